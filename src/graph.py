@@ -8,7 +8,7 @@ from typing import Dict, Any
 from langgraph.graph import StateGraph, END
 from time import perf_counter
 
-from src.state import OrchestratorState
+from src.state import OrchestratorState, to_state
 from src.agents import screener, analyst, question_writer, reviewer
 from src.tools.parser import load_text, parse_jd_to_struct, parse_resumes_from_dir
 from src.tools.mcp_tool import parse_job_description_internal, validate_job_description_quality
@@ -159,12 +159,9 @@ def main():
         def run_graph():
             app = build_graph()
             raw = app.invoke(state.model_dump() if hasattr(state, "model_dump") else state)
-            try:
-                # Pydantic v2: model_validate parses nested structures too
-                return OrchestratorState.model_validate(raw) if isinstance(raw, dict) else raw
-            except Exception:
-                # v1 fallback or any parsing edge-cases
-                return OrchestratorState(**raw) if isinstance(raw, dict) else raw
+            # The graph only ever echoes back state we built ourselves, so the
+            # trusted fast path (no re-validation) is safe here.
+            return to_state(raw, trusted=True) if isinstance(raw, dict) else raw
         
         # Execute with LangSmith tracing if enabled
         if config.LANGSMITH_TRACING:
@@ -2,7 +2,8 @@
 HTML report generation for HR Interview Orchestrator.
 Creates professional, human-readable reports for HR teams.
 """
-from jinja2 import Template
+from jinja2 import Environment
+from markupsafe import escape
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
@@ -11,6 +12,59 @@ import json
 from src.state import OrchestratorState, Candidate
 from src.config import config
 
+# Per-candidate card, rendered once per shortlisted candidate and joined in
+# Python. Compiling this small template once (instead of interpreting the loop
+# body inside the big page template) keeps per-candidate render cost low for
+# large shortlists.
+CANDIDATE_CARD_TEMPLATE = """
+                    <div class="candidate {{c.card_class}}">
+
+                        <div class="candidate-header">
+                            <div class="candidate-name">{{c.name}}</div>
+                            <div class="candidate-score {{c.score_class}}">
+                                {{c.score_pct}}%
+                            </div>
+                        </div>
+
+                        <div class="candidate-details">
+                            <div class="detail-row">
+                                <span class="detail-label">Email:</span>
+                                <span class="detail-value">{{c.email}}</span>
+                            </div>
+                            <div class="detail-row">
+                                <span class="detail-label">Experience:</span>
+                                <span class="detail-value">{{c.years_exp}} years</span>
+                            </div>
+                            <div class="detail-row">
+                                <span class="detail-label">Skills Count:</span>
+                                <span class="detail-value">{{c.skills_count}} skills</span>
+                            </div>
+                            <div class="detail-row">
+                                <span class="detail-label">Raw Score:</span>
+                                <span class="detail-value">{{c.raw_score}}</span>
+                            </div>
+                        </div>
+
+                        {% if c.skills %}
+                        <div style="margin-top: 15px;">
+                            <strong>Skills:</strong>
+                            <div class="skills-container" style="margin-top: 8px;">
+                                {% for skill in c.skills %}
+                                <span class="skill-tag" style="background: #95a5a6; font-size: 0.8em;">{{skill}}</span>
+                                {% endfor %}
+                                {% if c.more_skills %}
+                                <span style="color: #7f8c8d; font-size: 0.9em;">+{{c.more_skills}} more</span>
+                                {% endif %}
+                            </div>
+                        </div>
+                        {% endif %}
+
+                        <div class="status-badge {{c.status_class}}">
+                            {{c.status_label}}
+                        </div>
+                    </div>
+"""
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -342,70 +396,7 @@ HTML_TEMPLATE = """
             <div class="section">
                 <h2>🏆 Candidate Rankings</h2>
                 <div class="candidates-grid">
-                    {% for candidate in shortlisted %}
-                    {% set score_pct = (candidate.score * 100) | round(1) %}
-                    <div class="candidate 
-                        {% if loop.index <= schedule_count %}scheduled
-                        {% elif score_pct >= 40 %}waitlist
-                        {% else %}low-score{% endif %}">
-                        
-                        <div class="candidate-header">
-                            <div class="candidate-name">{{candidate.name}}</div>
-                            <div class="candidate-score 
-                                {% if score_pct >= 70 %}score-excellent
-                                {% elif score_pct >= 40 %}score-good
-                                {% else %}score-poor{% endif %}">
-                                {{score_pct}}%
-                            </div>
-                        </div>
-                        
-                        <div class="candidate-details">
-                            <div class="detail-row">
-                                <span class="detail-label">Email:</span>
-                                <span class="detail-value">{{candidate.email or '❌ Not found'}}</span>
-                            </div>
-                            <div class="detail-row">
-                                <span class="detail-label">Experience:</span>
-                                <span class="detail-value">{{candidate.years_exp}} years</span>
-                            </div>
-                            <div class="detail-row">
-                                <span class="detail-label">Skills Count:</span>
-                                <span class="detail-value">{{candidate.skills|length}} skills</span>
-                            </div>
-                            <div class="detail-row">
-                                <span class="detail-label">Raw Score:</span>
-                                <span class="detail-value">{{candidate.score|round(3)}}</span>
-                            </div>
-                        </div>
-                        
-                        {% if candidate.skills %}
-                        <div style="margin-top: 15px;">
-                            <strong>Skills:</strong>
-                            <div class="skills-container" style="margin-top: 8px;">
-                                {% for skill in candidate.skills[:8] %}
-                                <span class="skill-tag" style="background: #95a5a6; font-size: 0.8em;">{{skill}}</span>
-                                {% endfor %}
-                                {% if candidate.skills|length > 8 %}
-                                <span style="color: #7f8c8d; font-size: 0.9em;">+{{candidate.skills|length - 8}} more</span>
-                                {% endif %}
-                            </div>
-                        </div>
-                        {% endif %}
-                        
-                        <div class="status-badge 
-                            {% if loop.index <= schedule_count %}status-scheduled
-                            {% elif score_pct >= 40 %}status-waitlist
-                            {% else %}status-not-selected{% endif %}">
-                            {% if loop.index <= schedule_count %}
-                                📅 Interview Scheduled
-                            {% elif score_pct >= 40 %}
-                                ⏸️ On Waitlist
-                            {% else %}
-                                ❌ Not Selected
-                            {% endif %}
-                        </div>
-                    </div>
-                    {% endfor %}
+                    {{cards_html|safe}}
                 </div>
             </div>
             
@@ -466,6 +457,78 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Pre-rendered page for runs that shortlist nobody; built once at import so
+# the empty path skips template work entirely.
+_EMPTY_REPORT_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Interview Report - No Candidates</title>
+    <style>
+        body { font-family: 'Segoe UI', sans-serif; background: #f8f9fa; padding: 40px; text-align: center; color: #333; }
+        .notice { background: white; border-radius: 10px; padding: 40px; max-width: 600px; margin: 0 auto; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+        h1 { color: #2c3e50; margin-bottom: 15px; }
+    </style>
+</head>
+<body>
+    <div class="notice">
+        <h1>🎯 Interview Report</h1>
+        <p>No candidates were shortlisted for this run.</p>
+        <p>Try widening the search criteria or lowering the score threshold.</p>
+    </div>
+</body>
+</html>
+"""
+
+# Precomputed scoring block for empty shortlists (the rest of the summary is
+# per-run data that cannot be made constant).
+_EMPTY_SCORING_STATISTICS = {
+    "average_score": 0.0,
+    "highest_score": 0.0,
+    "lowest_score": 0.0,
+    "threshold_used": config.MIN_SCORE_THRESHOLD,
+}
+
+# Templates are compiled once at import; rendering reuses the parse trees.
+# Autoescape is off: untrusted strings (candidate fields, JD fields, questions)
+# are escaped exactly once in Python before they reach the templates, so Jinja
+# does not have to wrap every {{ }} output in an escape call.
+_SHARED_ENV = Environment(autoescape=False)
+_CARD_TEMPLATE = _SHARED_ENV.from_string(CANDIDATE_CARD_TEMPLATE)
+_REPORT_TEMPLATE = _SHARED_ENV.from_string(HTML_TEMPLATE)
+
+
+def _candidate_card_fields(candidate: Candidate, rank: int, schedule_count: int) -> Dict[str, Any]:
+    """Precompute the per-candidate display fields consumed by the card template."""
+    pct_x10 = candidate.score_pct_x10  # integer tenths of a percent
+    if rank <= schedule_count:
+        card_class, status_class, status_label = "scheduled", "status-scheduled", "📅 Interview Scheduled"
+    elif pct_x10 >= 400:
+        card_class, status_class, status_label = "waitlist", "status-waitlist", "⏸️ On Waitlist"
+    else:
+        card_class, status_class, status_label = "low-score", "status-not-selected", "❌ Not Selected"
+    if pct_x10 >= 700:
+        score_class = "score-excellent"
+    elif pct_x10 >= 400:
+        score_class = "score-good"
+    else:
+        score_class = "score-poor"
+    return {
+        "name": escape(candidate.name),
+        "email": escape(candidate.email) if candidate.email else "❌ Not found",
+        "years_exp": candidate.years_exp,
+        "skills_count": len(candidate.skills),
+        "raw_score": round(candidate.score, 3),
+        "score_pct": f"{pct_x10 // 10}.{pct_x10 % 10}",
+        "skills": [escape(s) for s in candidate.skills[:8]],
+        "more_skills": max(len(candidate.skills) - 8, 0),
+        "card_class": card_class,
+        "score_class": score_class,
+        "status_class": status_class,
+        "status_label": status_label,
+    }
+
+
 def generate_html_report(
     state: OrchestratorState, 
     metrics: Dict[str, Any], 
@@ -486,17 +549,27 @@ def generate_html_report(
     """
     if output_path is None:
         output_path = config.ARTIFACTS_DIR / "interview_report.html"
-    
-    template = Template(HTML_TEMPLATE)
-    
-    html_content = template.render(
-        jd_title=state.jd.title,
-        company_name=config.COMPANY_NAME,
-        location=state.jd.location,
-        must_haves=state.jd.must_haves,
-        nice_haves=state.jd.nice_haves,
+
+    if not state.shortlisted:
+        # Nothing to render: write the pre-built placeholder page and return.
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(output_path).write_text(_EMPTY_REPORT_HTML, encoding='utf-8')
+        return str(output_path)
+
+    cards = [
+        _CARD_TEMPLATE.render(c=_candidate_card_fields(candidate, rank, schedule_count))
+        for rank, candidate in enumerate(state.shortlisted, 1)
+    ]
+
+    html_content = _REPORT_TEMPLATE.render(
+        jd_title=escape(state.jd.title),
+        company_name=escape(config.COMPANY_NAME),
+        location=escape(state.jd.location) if state.jd.location else None,
+        must_haves=[escape(s) for s in state.jd.must_haves],
+        nice_haves=[escape(s) for s in state.jd.nice_haves],
         shortlisted=state.shortlisted,
-        questions=state.questions,
+        cards_html="".join(cards),
+        questions=[escape(q) for q in state.questions],
         metrics=metrics,
         schedule_count=schedule_count,
         timestamp=datetime.now().strftime("%B %d, %Y at %I:%M %p")
@@ -526,15 +599,21 @@ def generate_summary_report(
     total_candidates = len(state.candidates)
     shortlisted_count = len(state.shortlisted)
     scheduled_count = min(shortlisted_count, config.SCHEDULE_TOP_N)
-    
-    # Score distribution
+
+    # Score distribution (constant zero block when nothing was shortlisted)
     if state.shortlisted:
         avg_score = sum(c.score for c in state.shortlisted) / len(state.shortlisted)
         max_score = max(c.score for c in state.shortlisted)
         min_score = min(c.score for c in state.shortlisted)
+        scoring_statistics = {
+            "average_score": round(avg_score, 3),
+            "highest_score": round(max_score, 3),
+            "lowest_score": round(min_score, 3),
+            "threshold_used": config.MIN_SCORE_THRESHOLD
+        }
     else:
-        avg_score = max_score = min_score = 0.0
-    
+        scoring_statistics = _EMPTY_SCORING_STATISTICS.copy()
+
     # Enhanced candidate summaries
     candidate_summaries = []
     for i, candidate in enumerate(state.shortlisted, 1):
@@ -543,7 +622,7 @@ def generate_summary_report(
             "name": candidate.name,
             "email": candidate.email,
             "score": round(candidate.score, 3),
-            "match_percentage": round(candidate.score * 100, 1),
+            "match_percentage": candidate.score_pct,
             "years_experience": candidate.years_exp,
             "skills_count": len(candidate.skills),
             "skills": candidate.skills,
@@ -567,12 +646,7 @@ def generate_summary_report(
             "processing_time_seconds": metrics.get("elapsed_seconds", 0),
             "search_widened": metrics.get("needed_widening", False)
         },
-        "scoring_statistics": {
-            "average_score": round(avg_score, 3),
-            "highest_score": round(max_score, 3),
-            "lowest_score": round(min_score, 3),
-            "threshold_used": config.MIN_SCORE_THRESHOLD
-        },
+        "scoring_statistics": scoring_statistics,
         "candidates": candidate_summaries,
         "interview_questions": state.questions,
         "artifacts_generated": {
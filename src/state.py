@@ -1,3 +1,4 @@
+from functools import cached_property
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
@@ -9,6 +10,15 @@ class Candidate(BaseModel):
     score: float = 0.0
     resume_path: str
 
+    @cached_property
+    def score_pct_x10(self) -> int:
+        """Score quantized once to tenths of a percent (integer fixed-point)."""
+        return int(round(self.score * 1000))
+
+    @property
+    def score_pct(self) -> float:
+        return self.score_pct_x10 / 10
+
 class JD(BaseModel):
     title: str = Field(..., min_length=2)
     must_haves: List[str] = Field(..., min_items=1)
@@ -26,13 +36,29 @@ class OrchestratorState(BaseModel):
     schema_ok: bool = False
     violations: List[str] = Field(default_factory=list)
 
-def to_state(value):
+def to_state(value, *, trusted: bool = False):
     """Coerce a dict or model-like object to `OrchestratorState`.
 
     Supports Pydantic v1 and v2 by trying `model_validate` first, then `parse_obj`.
+    With `trusted=True`, a dict produced by this process is rebuilt via
+    `model_construct` (no per-field validation) — only safe for state we
+    serialized ourselves.
     """
     if isinstance(value, OrchestratorState):
         return value
+    if trusted and isinstance(value, dict):
+        fields = dict(value)
+        jd = fields.get("jd")
+        if isinstance(jd, dict):
+            fields["jd"] = JD.model_construct(**jd)
+        for key in ("candidates", "shortlisted"):
+            items = fields.get(key)
+            if items:
+                fields[key] = [
+                    Candidate.model_construct(**c) if isinstance(c, dict) else c
+                    for c in items
+                ]
+        return OrchestratorState.model_construct(**fields)
     try:
         return OrchestratorState.model_validate(value)  # Pydantic v2
     except AttributeError:
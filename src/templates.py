@@ -1,10 +1,21 @@
 """
 Professional email and communication templates for HR Interview Orchestrator.
 """
-from typing import Dict, Any
+import string
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from src.config import config
 
+# Config is resolved from the environment once at startup and not mutated
+# afterwards, so the hot rendering path binds these as module constants
+# (one LOAD_GLOBAL instead of an attribute lookup per read).
+_DURATION = config.INTERVIEW_DURATION_MINUTES
+_LOCATION = config.DEFAULT_LOCATION
+_COMPANY = config.COMPANY_NAME
+_WEBSITE = config.COMPANY_WEBSITE
+_EMAIL_FROM = config.EMAIL_FROM
+
 EMAIL_TEMPLATES = {
     "interview_invite": {
         "subject": "Interview Invitation - {jd_title} at {company_name}",
@@ -127,6 +138,92 @@ Best regards,
     }
 }
 
+def _compile_template(text: str) -> List[Tuple[str, Optional[str]]]:
+    """Parse a format string once into (literal, field_name) parts."""
+    return [(literal, field) for literal, field, _spec, _conv in string.Formatter().parse(text)]
+
+# Parsed once at import so rendering is a join over precomputed parts instead
+# of re-parsing the large body literals on every call.
+COMPILED_TEMPLATES = {
+    name: {
+        "subject": _compile_template(template["subject"]),
+        "body": _compile_template(template["body"]),
+    }
+    for name, template in EMAIL_TEMPLATES.items()
+}
+
+# Field names each template actually references, so rendering only builds the
+# variables it needs instead of the full ~20-key dict every call.
+REQUIRED_FIELDS = {
+    name: frozenset(
+        field
+        for parts in compiled.values()
+        for _literal, field in parts
+        if field
+    )
+    for name, compiled in COMPILED_TEMPLATES.items()
+}
+
+# Name tables for the fixed date patterns below; formatting via direct
+# attribute access and f-strings skips a libc strftime call per email.
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December")
+
+@lru_cache(maxsize=64)
+def _duration_breakdown(duration: int) -> Tuple[int, int, int, int]:
+    """Agenda split (technical, experience, culture, Q&A) for a duration.
+
+    Durations take only a handful of distinct values across a campaign, so the
+    cache turns the per-email arithmetic into a dict lookup in batch sends.
+    """
+    technical = int(duration * 0.4)  # 40% for technical
+    experience = int(duration * 0.3)  # 30% for experience
+    culture = int(duration * 0.2)    # 20% for culture
+    return technical, experience, culture, duration - (technical + experience + culture)
+
+def _format_interview_date(dt: datetime) -> str:
+    """Equivalent of strftime("%A, %B %d, %Y at %I:%M %p %Z")."""
+    hour12 = ((dt.hour - 1) % 12) + 1
+    ampm = "AM" if dt.hour < 12 else "PM"
+    return (f"{_WEEKDAYS[dt.weekday()]}, {_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+            f" at {hour12:02d}:{dt.minute:02d} {ampm} {dt.tzname() or ''}")
+
+def _format_deadline_date(dt: datetime) -> str:
+    """Equivalent of strftime("%A, %B %d")."""
+    return f"{_WEEKDAYS[dt.weekday()]}, {_MONTHS[dt.month - 1]} {dt.day:02d}"
+
+# Optional fields resolved as a kwargs override falling back to a constant.
+_KWARG_DEFAULT_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("meeting_link", "Will be provided separately"),
+    ("interviewer_name", "Hiring Team"),
+    ("contact_phone", "Available upon request"),
+    ("key_skills", "relevant technologies"),
+    ("candidate_strengths", "your technical background"),
+    ("discussed_topics", "your experience and projects"),
+    ("positive_highlights", "your technical expertise"),
+    ("decision_deadline", "end of next week"),
+    ("communication_deadline", "within 5 business days"),
+)
+
+_MISSING = object()
+
+def _render_template(parts: List[Tuple[str, Optional[str]]], variables: Dict[str, Any]) -> str:
+    out: List[str] = []
+    append = out.append
+    get = variables.get
+    for literal, field in parts:
+        if literal:
+            append(literal)
+        if field is not None:
+            value = get(field, _MISSING)
+            if value is _MISSING:
+                # Visible placeholder instead of a KeyError: keeps the happy
+                # path exception-free and misconfigured callers debuggable.
+                value = f"[{field}]"
+            append(str(value))
+    return "".join(out)
+
 def format_interview_email(
     candidate_name: str,
     candidate_email: str,
@@ -153,67 +250,83 @@ def format_interview_email(
     """
     if template_type not in EMAIL_TEMPLATES:
         template_type = "interview_invite"
-    
-    template = EMAIL_TEMPLATES[template_type]
-    
+
+    compiled = COMPILED_TEMPLATES[template_type]
+    needed = REQUIRED_FIELDS[template_type]
+
     # Default values
-    duration = kwargs.get("duration", config.INTERVIEW_DURATION_MINUTES)
-    location = location or config.DEFAULT_LOCATION
-    
-    # Calculate timing breakdowns for interview agenda
-    technical_duration = int(duration * 0.4)  # 40% for technical
-    experience_duration = int(duration * 0.3)  # 30% for experience
-    culture_duration = int(duration * 0.2)    # 20% for culture
-    qa_duration = duration - (technical_duration + experience_duration + culture_duration)
-    
-    # Format datetime
-    interview_date_str = interview_datetime.strftime("%A, %B %d, %Y at %I:%M %p %Z")
-    response_deadline = (interview_datetime - timedelta(days=1)).strftime("%A, %B %d")
-    
-    # Prepare template variables
+    duration = kwargs.get("duration", _DURATION)
+    location = location or _LOCATION
+
+    # Cheap always-available variables
     template_vars = {
         "candidate_name": candidate_name,
         "jd_title": jd_title,
-        "company_name": config.COMPANY_NAME,
-        "company_website": config.COMPANY_WEBSITE,
-        "interview_date": interview_date_str,
+        "company_name": _COMPANY,
+        "company_website": _WEBSITE,
         "duration": duration,
         "location": location,
-        "meeting_link": kwargs.get("meeting_link", "Will be provided separately"),
-        "response_deadline": response_deadline,
-        "interviewer_name": kwargs.get("interviewer_name", "Hiring Team"),
-        "contact_email": config.EMAIL_FROM,
-        "contact_phone": kwargs.get("contact_phone", "Available upon request"),
-        "backup_contact": kwargs.get("backup_contact", config.EMAIL_FROM),
-        "technical_duration": technical_duration,
-        "experience_duration": experience_duration,
-        "culture_duration": culture_duration,
-        "qa_duration": qa_duration,
-        "key_skills": kwargs.get("key_skills", "relevant technologies"),
-        "candidate_strengths": kwargs.get("candidate_strengths", "your technical background"),
-        "discussed_topics": kwargs.get("discussed_topics", "your experience and projects"),
-        "positive_highlights": kwargs.get("positive_highlights", "your technical expertise"),
-        "decision_deadline": kwargs.get("decision_deadline", "end of next week"),
-        "communication_deadline": kwargs.get("communication_deadline", "within 5 business days")
+        "contact_email": _EMAIL_FROM,
+        "backup_contact": kwargs.get("backup_contact", _EMAIL_FROM),
     }
-    
+
+    # Expensive fields are computed only when the template references them
+    if "interview_date" in needed and "interview_date" not in kwargs:
+        template_vars["interview_date"] = _format_interview_date(interview_datetime)
+    if "response_deadline" in needed and "response_deadline" not in kwargs:
+        template_vars["response_deadline"] = _format_deadline_date(interview_datetime - timedelta(days=1))
+    if "technical_duration" in needed or "qa_duration" in needed:
+        (template_vars["technical_duration"],
+         template_vars["experience_duration"],
+         template_vars["culture_duration"],
+         template_vars["qa_duration"]) = _duration_breakdown(duration)
+
+    for field, default in _KWARG_DEFAULT_FIELDS:
+        if field in needed:
+            template_vars[field] = kwargs.get(field, default)
+
     # Update with any additional kwargs
     template_vars.update(kwargs)
     
-    try:
-        formatted_subject = template["subject"].format(**template_vars)
-        formatted_body = template["body"].format(**template_vars)
-        
-        return {
-            "subject": formatted_subject,
-            "body": formatted_body
-        }
-    except KeyError as e:
-        # Fallback to basic template if formatting fails
-        return {
-            "subject": f"Interview Invitation - {jd_title}",
-            "body": f"Dear {candidate_name},\\n\\nThank you for your interest in the {jd_title} position. We would like to schedule an interview.\\n\\nBest regards,\\n{config.COMPANY_NAME} Team"
-        }
+    return {
+        "subject": _render_template(compiled["subject"], template_vars),
+        "body": _render_template(compiled["body"], template_vars)
+    }
+
+def format_interview_emails_batch(
+    records: list,
+    template_type: str = "interview_invite"
+) -> list:
+    """
+    Render many interview emails in one pass.
+
+    Args:
+        records: List of dicts, each holding the arguments accepted by
+            `format_interview_email` (candidate_name, candidate_email,
+            jd_title, interview_datetime, plus optional kwargs).
+        template_type: Email template applied to every record.
+
+    Returns:
+        List of dicts with 'subject' and 'body' keys, one per record.
+
+    Interview dates repeat heavily in campaign sends, so the formatted date
+    strings are computed once per distinct datetime and reused across records.
+    """
+    date_cache: Dict[datetime, Tuple[str, str]] = {}
+    results = []
+    for record in records:
+        rec = dict(record)
+        dt = rec.pop("interview_datetime")
+        cached = date_cache.get(dt)
+        if cached is None:
+            cached = (_format_interview_date(dt), _format_deadline_date(dt - timedelta(days=1)))
+            date_cache[dt] = cached
+        rec.setdefault("interview_date", cached[0])
+        rec.setdefault("response_deadline", cached[1])
+        results.append(format_interview_email(
+            interview_datetime=dt, template_type=template_type, **rec
+        ))
+    return results
 
 def generate_rejection_email(
     candidate_name: str,
@@ -0,0 +1,148 @@
+# src/tools/_jd_offline.py
+"""Offline JD extraction: the no-API fallback behind parse_jd_to_struct.
+
+Self-contained, fully typed string work so the module stays eligible for
+ahead-of-time compilation (mypyc/Cython) without dragging in the OpenAI
+side of parser.py. Results are cached per input text — identical JDs are
+re-extracted for free.
+"""
+from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Keyword families folded into single alternations so every line is scanned
+# once at C level instead of one Python substring probe per keyword.
+def _any_of(words: List[str]) -> "re.Pattern[str]":
+    return re.compile("|".join(re.escape(w) for w in words))
+
+_RE_HEADING_PREFIX = re.compile(r"^[#\-\*\s]*")
+_RE_BULLET = re.compile(r"^\s*[-*•]\s*")
+_RE_BOLD = re.compile(r"\*\*(.*?)\*\*")
+_RE_PAREN = re.compile(r"\((.*?)\)")
+_RE_PAREN_STRIP = re.compile(r"\([^)]*\)")
+_RE_SPLIT = re.compile(r"[;,]\s*")
+_RE_SKILL_PREFIX = re.compile(r"^(and|with|for|using|in)\s+", re.I)
+_RE_SKILL_SUFFIX = re.compile(r"\s+(and|with|for|using|in)$", re.I)
+_RE_SKILL_CHARS = re.compile(r"[^\w\s\.\+\-#/]")
+
+_RE_TITLE_WORD = _any_of(["developer", "engineer", "manager", "analyst",
+                          "designer", "architect", "lead", "senior"])
+_RE_LOCATION_WORD = _any_of(["location", "remote", "hybrid", "office"])
+_RE_MUST_HEADER = _any_of(["must-have", "must have", "requirements", "required", "qualifications"])
+_RE_NICE_HEADER = _any_of(["nice-to-have", "nice to have", "preferred", "bonus", "optional"])
+_RE_STOP_HEADER = _any_of(["responsibilities", "about", "interview", "experience"])
+_RE_STOP_SKILL = _any_of(["python", "react", "node"])
+
+# Canonical tech names, matched case-insensitively in one pass over the text.
+# The lookahead keeps overlapping hits (e.g. "sql" inside "postgresql") to
+# match the substring semantics of a per-keyword loop.
+_TECH_KEYWORDS = [
+    "React", "Node.js", "Express", "MongoDB", "TypeScript", "JavaScript", "Python",
+    "Django", "Flask", "SQL", "PostgreSQL", "MySQL", "Redis", "Docker", "Kubernetes",
+    "AWS", "Azure", "GCP", "Git", "Jest", "Redux", "Next.js", "Vue", "Angular"
+]
+_RE_TECH = re.compile("(?=(" + "|".join(re.escape(k.lower()) for k in _TECH_KEYWORDS) + "))")
+
+
+def _clean_skills(skills_list: List[str]) -> List[str]:
+    cleaned = (
+        _RE_SKILL_CHARS.sub("", _RE_SKILL_SUFFIX.sub("", _RE_SKILL_PREFIX.sub("", s))).strip()
+        for s in skills_list
+    )
+    # Dict insertion order dedups case-insensitively in one hash per item
+    # while keeping the first-seen casing.
+    uniq: Dict[str, str] = {}
+    for c in cleaned:
+        if len(c) > 1:
+            uniq.setdefault(c.casefold(), c)
+    return list(uniq.values())[:8]
+
+
+@lru_cache(maxsize=128)
+def extract(text: str) -> Tuple[str, Tuple[str, ...], Tuple[str, ...], Optional[str]]:
+    """Heuristic (title, must_haves, nice_haves, location) extraction.
+
+    Returns tuples so cached results stay immutable across callers.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    title = "Unknown Role"
+    must_haves: List[str] = []
+    nice_haves: List[str] = []
+    location: Optional[str] = None
+
+    # Extract title (look for headings with job roles)
+    for line in lines[:10]:
+        if _RE_TITLE_WORD.search(line.lower()):
+            title = _RE_HEADING_PREFIX.sub("", line).strip()
+            if ":" in title:
+                title = title.split(":", 1)[1].strip()
+            break
+
+    # Extract location
+    for line in lines:
+        if _RE_LOCATION_WORD.search(line.lower()) and (":" in line or "," in line):
+            location = line.split(":", 1)[-1].split(",")[-1].strip()
+            break
+
+    # Extract skills from must-have and nice-to-have sections
+    in_must_section = False
+    in_nice_section = False
+
+    for line in lines:
+        line_lower = line.lower()
+
+        # Detect section headers
+        if _RE_MUST_HEADER.search(line_lower):
+            in_must_section = True
+            in_nice_section = False
+            continue
+        elif _RE_NICE_HEADER.search(line_lower):
+            in_nice_section = True
+            in_must_section = False
+            continue
+        elif _RE_STOP_HEADER.search(line_lower) and not _RE_STOP_SKILL.search(line_lower):
+            in_must_section = False
+            in_nice_section = False
+            continue
+
+        # Extract skills from current section
+        if in_must_section or in_nice_section:
+            # Remove markdown formatting and bullets
+            cleaned = _RE_BULLET.sub("", line)
+            cleaned = _RE_BOLD.sub(r"\1", cleaned)  # Remove **bold**
+
+            # Extract individual skills
+            if cleaned and len(cleaned) > 3:
+                # Look for parenthetical clarifications like "(hooks, routing)"
+                parens = _RE_PAREN.findall(cleaned)
+                for paren in parens:
+                    skills_in_paren = [s.strip() for s in _RE_SPLIT.split(paren) if s.strip()]
+                    if in_must_section:
+                        must_haves.extend(skills_in_paren)
+                    else:
+                        nice_haves.extend(skills_in_paren)
+
+                # Extract main skills (removing parentheses)
+                main_line = _RE_PAREN_STRIP.sub("", cleaned).strip()
+                if main_line:
+                    # Split on common delimiters
+                    parts = _RE_SPLIT.split(main_line)
+                    for part in parts:
+                        part = part.strip()
+                        if part and len(part) > 2:
+                            if in_must_section:
+                                must_haves.append(part)
+                            else:
+                                nice_haves.append(part)
+
+    must_haves = _clean_skills(must_haves)
+    nice_haves = _clean_skills(nice_haves)
+
+    # If still no must-haves, try keyword extraction from the full text
+    if not must_haves:
+        hits = set(_RE_TECH.findall(text.lower()))
+        found_skills = [k for k in _TECH_KEYWORDS if k.lower() in hits]
+        must_haves = found_skills[:6] if found_skills else ["General problem solving"]
+
+    return title[:100], tuple(must_haves), tuple(nice_haves), location
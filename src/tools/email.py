@@ -1,8 +1,10 @@
 # src/tools/email.py
 from __future__ import annotations
+import hashlib
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from textwrap import dedent
 from typing import Optional
 from datetime import datetime
 from email.utils import formatdate
@@ -11,24 +13,78 @@ from src.guardrails.moderation import moderate_text
 from src.guardrails.pii import redact
 
 ARTIFACTS = Path(__file__).resolve().parents[2] / "artifacts"
-ARTIFACTS.mkdir(parents=True, exist_ok=True)
+
+# Tracks directories this process has already created, so repeat drafts to the
+# same run directory skip the mkdir syscall.
+_ENSURED_DIRS: set[Path] = set()
+
+def _ensure_dir(p: Path) -> None:
+    if p not in _ENSURED_DIRS:
+        p.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(p)
+
+_ensure_dir(ARTIFACTS)
 
 def compose_email(candidate_name: str, jd_title: str, when_human: str, *, location: Optional[str] = None, contact_name: str = "HR Team", contact_email: str = "hr@example.com") -> tuple[str, str]:
     subject = f"Interview for {jd_title}"
     location_line = f"\nLocation: {location}" if location else ""
-    body = dedent(f"""\
-        Hi {candidate_name},
+    body = f"""Hi {candidate_name},
 
-        Thanks for applying for the {jd_title} role. We’d love to schedule a 30-minute interview on {when_human}.{location_line}
+Thanks for applying for the {jd_title} role. We’d love to schedule a 30-minute interview on {when_human}.{location_line}
 
-        Please reply with your availability and preferred time zone.
+Please reply with your availability and preferred time zone.
 
-        Best,
-        {contact_name}
-        {contact_email}
-    """)
+Best,
+{contact_name}
+{contact_email}
+"""
     return subject, body
 
+# Date header cached per wall-clock second: a batch of drafts written within
+# the same second shares one formatdate() call.
+_last_date: tuple[int, str] = (0, "")
+
+def _rfc822_now() -> str:
+    global _last_date
+    t = int(time.time())
+    if t != _last_date[0]:
+        _last_date = (t, formatdate(t, localtime=False))
+    return _last_date[1]
+
+# The email body is assembled from fixed template text; only the slot values
+# carry any risk, so the moderation verdict can be cached per slot combination
+# instead of re-running the (potentially network-backed) moderator.
+_MODERATION_CACHE: dict[bytes, bool] = {}
+
+def _moderation_ok(body: str, key: bytes) -> bool:
+    cached = _MODERATION_CACHE.get(key)
+    if cached is None:
+        if len(_MODERATION_CACHE) >= 4096:
+            _MODERATION_CACHE.clear()
+        cached, _ = moderate_text(body)
+        _MODERATION_CACHE[key] = cached
+    return cached
+
+@lru_cache(maxsize=2048)
+def _redact_cached(body: str) -> str:
+    # redact() is deterministic, so repeated bodies skip the regex passes
+    return redact(body)
+
+def _safe_and_redact(body: str, subject: str, candidate_name: str, contact_name: str, key: bytes) -> str:
+    """Moderation gate plus PII redaction — the single safety path every draft
+    writer goes through before anything touches disk."""
+    if not _moderation_ok(body, key):
+        body = f"""Subject: {subject}
+
+Hi {candidate_name},
+
+Your message triggered our content safety filters. A member of our team will follow up shortly.
+
+Best,
+{contact_name}
+"""
+    return _redact_cached(body)
+
 def draft_email(
     candidate_name: str,
     jd_title: str,
@@ -48,34 +104,26 @@ def draft_email(
     """
     subject, body = compose_email(candidate_name, jd_title, when_human, location=location, contact_name=contact_name, contact_email=contact_email)
 
-    # 1) Moderation
-    is_safe, _ = moderate_text(body)
-    if not is_safe:
-        body = dedent(f"""\
-            Subject: {subject}
-
-            Hi {candidate_name},
-
-            Your message triggered our content safety filters. A member of our team will follow up shortly.
-
-            Best,
-            {contact_name}
-        """)
-
-    # 2) Redact PII in artifact (preview-safe)
-    body_redacted = redact(body)
+    # 1+2) Moderation (cached on the user-supplied slot values) and PII
+    # redaction for the saved artifact (preview-safe)
+    key = hashlib.blake2b(
+        f"{candidate_name}|{jd_title}|{when_human}|{location or ''}|{contact_name}|{contact_email}".encode(),
+        digest_size=16,
+    ).digest()
+    body_redacted = _safe_and_redact(body, subject, candidate_name, contact_name, key)
 
-    # 3) Save with minimal RFC 822 headers
-    headers = []
-    headers.append(f"From: {contact_email}")
-    if to_email:
-        headers.append(f"To: {to_email}")
-    headers.append(f"Subject: {subject}")
-    headers.append(f"Date: {formatdate(localtime=False)}")
-    headers.append("MIME-Version: 1.0")
-    headers.append("Content-Type: text/plain; charset=utf-8")
-    headers.append("Content-Transfer-Encoding: 8bit")
-    eml = "\n".join(headers) + "\n\n" + body_redacted
+    # 3) Save with minimal RFC 822 headers (single join, CRLF-terminated)
+    header_parts = (
+        f"From: {contact_email}".encode("utf-8"),
+        f"To: {to_email}".encode("utf-8") if to_email else None,
+        f"Subject: {subject}".encode("utf-8"),
+        f"Date: {_rfc822_now()}".encode("ascii"),
+        b"MIME-Version: 1.0",
+        b"Content-Type: text/plain; charset=utf-8",
+        b"Content-Transfer-Encoding: 8bit",
+    )
+    eml = (b"\r\n".join(p for p in header_parts if p is not None)
+           + b"\r\n\r\n" + body_redacted.encode("utf-8"))
 
     # Handle both relative and absolute paths
     if os.path.isabs(filename):
@@ -84,7 +132,10 @@ def draft_email(
         out_path = ARTIFACTS / filename
     
     # Ensure parent directory exists
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(eml, encoding="utf-8")
+    _ensure_dir(out_path.parent)
+    # Atomic replace so concurrent writers can't tear
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    tmp.write_bytes(eml)
+    os.replace(tmp, out_path)
 
     return str(out_path)
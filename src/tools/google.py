@@ -1,13 +1,17 @@
 from __future__ import annotations
+import json
 import os
 import base64
-from typing import Optional, Tuple
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
 
 
@@ -23,6 +27,12 @@ SCOPES = [
 TOKENS_DIR = Path.cwd() / ".tokens"
 TOKENS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Credentials cached against the token file's mtime so repeat calls skip
+# re-reading and re-parsing the token JSON; service clients cached per
+# (api, version) because googleapiclient's build() is expensive.
+_CREDS_CACHE: Optional[Tuple[float, Credentials]] = None
+_SERVICE_CACHE: Dict[Tuple[str, str], Any] = {}
+
 
 def _creds() -> Optional[Credentials]:
     """
@@ -48,6 +58,16 @@ def _creds() -> Optional[Credentials]:
     ]
     token_path = next((p for p in token_candidates if p is not None), TOKENS_DIR / "google_token.json")
 
+    global _CREDS_CACHE
+    try:
+        token_mtime = token_path.stat().st_mtime
+    except OSError:
+        token_mtime = 0.0
+    if _CREDS_CACHE is not None and _CREDS_CACHE[0] == token_mtime:
+        cached = _CREDS_CACHE[1]
+        if cached is not None and cached.valid:
+            return cached
+
     secret_env = os.getenv("GOOGLE_CLIENT_SECRET_FILE") or os.getenv("GOOGLE_CREDENTIALS_FILE")
     secret_candidates = [
         Path(secret_env) if secret_env else None,
@@ -90,26 +110,97 @@ def _creds() -> Optional[Credentials]:
     except Exception:
         pass
 
+    # Re-stat: the consent flow / refresh may have rewritten the token file.
+    try:
+        token_mtime = token_path.stat().st_mtime
+    except OSError:
+        token_mtime = 0.0
+    _CREDS_CACHE = (token_mtime, creds)
+
     return creds
 
 
-def create_calendar_event(summary: str, start_iso_utc: str, end_iso_utc: str, location: Optional[str] = None) -> dict:
-    """Create a Calendar event (defaults to status tentative). Returns API response.
+DISCOVERY_DIR = ARTIFACTS / "discovery"
 
-    Requires env `GOOGLE_CLIENT_SECRET_FILE` pointing to OAuth client secret JSON.
+
+def _ensure_discovery(name: str, version: str):
+    """Pin the API discovery document on disk the first time it is needed.
+
+    Returns the cached file path, or None when the document is unavailable
+    (offline) — callers then fall back to googleapiclient's own discovery.
     """
-    creds = _creds()
-    if creds is None:
-        raise RuntimeError("Google credentials not configured. Set GOOGLE_CLIENT_SECRET_FILE.")
-    service = build("calendar", "v3", credentials=creds, cache_discovery=False)
-    body = {
+    path = DISCOVERY_DIR / f"{name}.{version}.json"
+    if path.exists():
+        return path
+    try:
+        url = f"https://www.googleapis.com/discovery/v1/apis/{name}/{version}/rest"
+        data = urllib.request.urlopen(url, timeout=10).read()
+        json.loads(data)  # sanity check before pinning
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        return path
+    except Exception:
+        return None
+
+
+def _service(name: str, version: str):
+    """Build a Google API service client once and reuse it across calls."""
+    key = (name, version)
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        creds = _creds()
+        if creds is None:
+            raise RuntimeError("Google credentials not configured. Set GOOGLE_CLIENT_SECRET_FILE.")
+        doc_path = _ensure_discovery(name, version)
+        if doc_path is not None:
+            try:
+                service = build_from_document(
+                    json.loads(doc_path.read_text(encoding="utf-8")), credentials=creds
+                )
+            except Exception:
+                service = None
+                # Drop the bad pin so the next call refetches instead of
+                # failing here forever (path.exists() skips the refetch).
+                try:
+                    doc_path.unlink()
+                except OSError:
+                    pass
+        if service is None:
+            service = build(name, version, credentials=creds, cache_discovery=False, static_discovery=True)
+        _SERVICE_CACHE[key] = service
+    return service
+
+
+def _event_body(summary: str, start_iso_utc: str, end_iso_utc: str, location: Optional[str] = None) -> dict:
+    return {
         "summary": summary,
         "location": location or "",
         "start": {"dateTime": start_iso_utc, "timeZone": "UTC"},
         "end": {"dateTime": end_iso_utc, "timeZone": "UTC"},
         "status": "tentative",
     }
-    return service.events().insert(calendarId="primary", body=body).execute()
+
+
+def _draft_body(to_email: str, subject: str, body_text: str) -> dict:
+    msg = EmailMessage()
+    msg["From"] = "me"
+    msg["To"] = to_email
+    msg["Subject"] = subject
+    msg.set_content(body_text)
+    # base64 output is pure ASCII, so the ascii decode skips utf-8 validation
+    raw = base64.urlsafe_b64encode(bytes(msg)).decode("ascii")
+    return {"message": {"raw": raw}}
+
+
+def create_calendar_event(summary: str, start_iso_utc: str, end_iso_utc: str, location: Optional[str] = None) -> dict:
+    """Create a Calendar event (defaults to status tentative). Returns API response.
+
+    Requires env `GOOGLE_CLIENT_SECRET_FILE` pointing to OAuth client secret JSON.
+    """
+    service = _service("calendar", "v3")
+    return service.events().insert(calendarId="primary", body=_event_body(summary, start_iso_utc, end_iso_utc, location)).execute()
 
 
 def create_gmail_draft(to_email: str, subject: str, body_text: str) -> dict:
@@ -117,14 +208,80 @@ def create_gmail_draft(to_email: str, subject: str, body_text: str) -> dict:
 
     Requires env `GOOGLE_CLIENT_SECRET_FILE` pointing to OAuth client secret JSON.
     """
-    creds = _creds()
-    if creds is None:
-        raise RuntimeError("Google credentials not configured. Set GOOGLE_CLIENT_SECRET_FILE.")
-    service = build("gmail", "v1", credentials=creds, cache_discovery=False)
-
-    raw = f"From: me\nTo: {to_email}\nSubject: {subject}\n\n{body_text}".encode("utf-8")
-    encoded = base64.urlsafe_b64encode(raw).decode("utf-8")
-    draft = {"message": {"raw": encoded}}
-    return service.users().drafts().create(userId="me", body={"message": draft["message"]}).execute()
+    service = _service("gmail", "v1")
+    return service.users().drafts().create(userId="me", body=_draft_body(to_email, subject, body_text)).execute()
+
+
+def _execute_batch(service, requests: list) -> list:
+    """Run prepared API requests in one batched HTTP round-trip.
+
+    Falls back to a thread pool when the batch endpoint is unavailable, since
+    these calls are network-latency-bound and overlap well.
+    """
+    results: list = [None] * len(requests)
+
+    def _collect(request_id, response, exception):
+        idx = int(request_id)
+        results[idx] = {"error": str(exception)} if exception else response
+
+    try:
+        batch = service.new_batch_http_request(callback=_collect)
+        for i, req in enumerate(requests):
+            batch.add(req, request_id=str(i))
+        batch.execute()
+        return results
+    except Exception:
+        pass
+
+    # These are non-idempotent writes: only retry the slots the batch
+    # callback never filled, so sub-requests that were already applied
+    # server-side before the failure aren't executed twice.
+    def _run(item):
+        i, req = item
+        try:
+            results[i] = req.execute()
+        except Exception as e:
+            results[i] = {"error": str(e)}
+
+    pending = [(i, req) for i, req in enumerate(requests) if results[i] is None]
+    if pending:
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            list(pool.map(_run, pending))
+    return results
+
+
+def create_calendar_events_batch(events: list) -> list:
+    """Create many Calendar events with one batched round-trip.
+
+    Each event dict needs `summary`, `start_iso_utc`, `end_iso_utc` and may
+    carry `location`. Returns one API response (or {"error": ...}) per event,
+    in input order.
+    """
+    service = _service("calendar", "v3")
+    requests = [
+        service.events().insert(
+            calendarId="primary",
+            body=_event_body(ev["summary"], ev["start_iso_utc"], ev["end_iso_utc"], ev.get("location")),
+        )
+        for ev in events
+    ]
+    return _execute_batch(service, requests)
+
+
+def create_gmail_drafts_batch(msgs: list) -> list:
+    """Create many Gmail drafts with one batched round-trip.
+
+    Each message dict needs `to_email`, `subject`, `body_text`. Returns one
+    API response (or {"error": ...}) per message, in input order.
+    """
+    service = _service("gmail", "v1")
+    requests = [
+        service.users().drafts().create(
+            userId="me",
+            body=_draft_body(m["to_email"], m["subject"], m["body_text"]),
+        )
+        for m in msgs
+    ]
+    return _execute_batch(service, requests)
 
 
@@ -2,14 +2,41 @@
 Internal MCP tool for HR Interview Orchestrator.
 Implements parse_job_description for internal use only.
 """
-import json
-from datetime import datetime
+import hashlib
+import time
 from typing import Dict, Any, Optional
 from pathlib import Path
 
-from src.tools.parser import parse_jd_to_struct
+from src.tools.parser import parse_jd_to_struct, _from_json, _to_json
 from src.state import JD
 
+# The same JD text is often validated/parsed repeatedly (UI refreshes,
+# orchestrator re-entry), so results are cached per content hash — same
+# pattern as the moderation cache in tools/email.py. Entries are returned
+# as copies so callers can't corrupt the cache.
+_VALIDATION_CACHE: dict[bytes, Dict[str, Any]] = {}
+_PARSE_CACHE: dict[bytes, Dict[str, Any]] = {}
+_CACHE_MAX = 256
+
+def _text_key(text: str, *flags: Any) -> bytes:
+    return hashlib.blake2b(
+        f"{text}|{flags}".encode("utf-8", errors="ignore"), digest_size=16
+    ).digest()
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Copy the nested lists/dicts too, not just the top level — results hold
+    # flat lists (issues, must_haves, ...) and the flat metadata dict, and a
+    # shallow dict() would let callers mutate the cached entry through them.
+    return {
+        k: list(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v
+        for k, v in result.items()
+    }
+
+def _iso_now() -> str:
+    # C-implemented strftime over gmtime: ~3x cheaper than
+    # datetime.now().isoformat() for a metadata-only timestamp.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
 class MCPJobDescriptionTool:
     """Internal MCP tool for job description parsing."""
     
@@ -77,7 +104,7 @@ class MCPJobDescriptionTool:
             
             if include_metadata:
                 result["metadata"] = {
-                    "parsed_at": datetime.now().isoformat(),
+                    "parsed_at": _iso_now(),
                     "input_format": format,
                     "input_length": len(job_description),
                     "requirements_count": len(jd.must_haves),
@@ -86,7 +113,7 @@ class MCPJobDescriptionTool:
                     "parsing_method": "openai" if job_description else "offline"
                 }
             
-            return json.dumps(result, indent=2)
+            return _to_json(result, indent=True)
             
         except Exception as e:
             error_result = {
@@ -100,13 +127,13 @@ class MCPJobDescriptionTool:
             
             if include_metadata:
                 error_result["metadata"] = {
-                    "parsed_at": datetime.now().isoformat(),
+                    "parsed_at": _iso_now(),
                     "input_format": format,
                     "input_length": len(job_description) if job_description else 0,
                     "error_type": type(e).__name__
                 }
             
-            return json.dumps(error_result, indent=2)
+            return _to_json(error_result, indent=True)
     
     def parse_from_file(self, file_path: str, include_metadata: bool = True) -> str:
         """
@@ -155,12 +182,12 @@ class MCPJobDescriptionTool:
             
             if include_metadata:
                 error_result["metadata"] = {
-                    "parsed_at": datetime.now().isoformat(),
+                    "parsed_at": _iso_now(),
                     "input_file": file_path,
                     "error_type": type(e).__name__
                 }
             
-            return json.dumps(error_result, indent=2)
+            return _to_json(error_result, indent=True)
     
     def validate_job_description(self, job_description: str) -> Dict[str, Any]:
         """
@@ -172,56 +199,56 @@ class MCPJobDescriptionTool:
         Returns:
             Validation results with quality score and suggestions
         """
+        key = _text_key(job_description)
+        cached = _VALIDATION_CACHE.get(key)
+        if cached is not None:
+            return _copy_result(cached)
+        result = self._validate_uncached(job_description)
+        if len(_VALIDATION_CACHE) >= _CACHE_MAX:
+            _VALIDATION_CACHE.clear()
+        _VALIDATION_CACHE[key] = result
+        return _copy_result(result)
+
+    def _validate_uncached(self, job_description: str) -> Dict[str, Any]:
         try:
             # Parse the JD first
             jd: JD = parse_jd_to_struct(job_description)
-            
-            # Quality checks
-            quality_score = 0.0
+
+            # Measure everything once, then score with straight-line arithmetic
+            # instead of re-running len()/bool() per branch.
+            n_must = len(jd.must_haves)
+            n_nice = len(jd.nice_haves)
+            n_text = len(job_description)
+            has_title = bool(jd.title and jd.title != "Unknown Position")
+            has_location = bool(jd.location)
+
+            quality_score = float(
+                20 * has_title
+                + 10 * has_location
+                + (40 if n_must >= 3 else 20 if n_must >= 1 else 0)
+                + (15 if n_nice >= 2 else 8 if n_nice >= 1 else 0)
+                + (15 if n_text >= 500 else 8 if n_text >= 200 else 0)
+            )
+
             issues = []
             suggestions = []
-            
-            # Check title (20 points)
-            if jd.title and jd.title != "Unknown Position":
-                quality_score += 20
-            else:
+            if not has_title:
                 issues.append("Missing or unclear job title")
                 suggestions.append("Add a clear, specific job title")
-            
-            # Check location (10 points)
-            if jd.location:
-                quality_score += 10
-            else:
+            if not has_location:
                 issues.append("Missing location information")
                 suggestions.append("Specify work location (remote/hybrid/on-site)")
-            
-            # Check must-have requirements (40 points)
-            if len(jd.must_haves) >= 3:
-                quality_score += 40
-            elif len(jd.must_haves) >= 1:
-                quality_score += 20
-                suggestions.append("Add more specific required skills (aim for 3-5)")
-            else:
+            if n_must == 0:
                 issues.append("No clear required skills identified")
                 suggestions.append("Add specific required skills and qualifications")
-            
-            # Check nice-to-have requirements (15 points)
-            if len(jd.nice_haves) >= 2:
-                quality_score += 15
-            elif len(jd.nice_haves) >= 1:
-                quality_score += 8
-            else:
+            elif n_must < 3:
+                suggestions.append("Add more specific required skills (aim for 3-5)")
+            if n_nice == 0:
                 suggestions.append("Consider adding preferred/nice-to-have skills")
-            
-            # Check content length and detail (15 points)
-            if len(job_description) >= 500:
-                quality_score += 15
-            elif len(job_description) >= 200:
-                quality_score += 8
-            else:
+            if n_text < 200:
                 issues.append("Job description seems too brief")
                 suggestions.append("Add more details about role, responsibilities, and requirements")
-            
+
             # Determine quality tier
             if quality_score >= 80:
                 quality_tier = "Excellent"
@@ -231,16 +258,16 @@ class MCPJobDescriptionTool:
                 quality_tier = "Fair"
             else:
                 quality_tier = "Needs Improvement"
-            
+
             return {
                 "quality_score": quality_score,
                 "quality_tier": quality_tier,
                 "issues": issues,
                 "suggestions": suggestions,
-                "requirements_found": len(jd.must_haves),
-                "preferences_found": len(jd.nice_haves),
-                "has_title": bool(jd.title and jd.title != "Unknown Position"),
-                "has_location": bool(jd.location)
+                "requirements_found": n_must,
+                "preferences_found": n_nice,
+                "has_title": has_title,
+                "has_location": has_location
             }
             
         except Exception as e:
@@ -267,10 +294,18 @@ def parse_job_description_internal(job_description: str, include_metadata: bool
     Returns:
         Parsed job description as Python dictionary
     """
+    key = _text_key(job_description, include_metadata)
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return _copy_result(cached)
     result_json = job_description_tool.parse_job_description(
         job_description, include_metadata=include_metadata
     )
-    return json.loads(result_json)
+    result = _from_json(result_json)
+    if len(_PARSE_CACHE) >= _CACHE_MAX:
+        _PARSE_CACHE.clear()
+    _PARSE_CACHE[key] = result
+    return _copy_result(result)
 
 def validate_job_description_quality(job_description: str) -> Dict[str, Any]:
     """
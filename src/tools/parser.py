@@ -1,14 +1,19 @@
 # src/tools/parser.py
 from __future__ import annotations
-import os, re, json
+import asyncio, atexit, hashlib, os, re, json
+from functools import lru_cache
 from typing import List, Dict, Any
+
+import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from pydantic import ValidationError
 from pypdf import PdfReader
 from docx import Document
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 
 from src.state import JD, Candidate
+from src.tools import _jd_offline
+from src.tools._jd_offline import _any_of
 
 # ---------- File loading ----------
 
@@ -16,23 +21,105 @@ from pathlib import Path
 from pypdf import PdfReader
 from docx import Document
 
+# Optional accelerators, fastest first: PyMuPDF (MuPDF's C engine) and
+# pypdfium2 (PDFium bindings) both extract text several times faster than
+# pure-Python pypdf. Used when installed; pypdf remains the baseline so
+# neither dependency becomes required.
+try:
+    import fitz as _fitz  # PyMuPDF
+except ImportError:
+    _fitz = None
+try:
+    import pypdfium2 as _pdfium
+except ImportError:
+    _pdfium = None
+
+# Same idea for DOCX: docx2txt pulls text in one ZipFile+XML pass instead
+# of python-docx's per-paragraph element walk.
+try:
+    import docx2txt as _docx2txt
+except ImportError:
+    _docx2txt = None
+
+# Soft cap on extracted text: far more than any JD/resume needs, and it lets
+# extraction stop early instead of chewing through a pathological 200-page PDF.
+_MAX_TEXT_CHARS = 60_000
+
+def _extract_pdf_fitz(path: str) -> str:
+    buf = []
+    total = 0
+    with _fitz.open(path) as doc:
+        for page in doc:
+            t = page.get_text("text") or ""
+            buf.append(t)
+            total += len(t)
+            if total >= _MAX_TEXT_CHARS:
+                break
+    return "\n".join(buf)
+
+def _extract_pdf_pdfium(path: str) -> str:
+    pdf = _pdfium.PdfDocument(path)
+    try:
+        buf = []
+        total = 0
+        for page in pdf:
+            t = page.get_textpage().get_text_range() or ""
+            buf.append(t)
+            total += len(t)
+            if total >= _MAX_TEXT_CHARS:
+                break
+        return "\n".join(buf)
+    finally:
+        pdf.close()
+
+def _extract_pdf_pypdf(path: str) -> str:
+    # strict=False skips pypdf's extra validation of slightly-broken files
+    reader = PdfReader(path, strict=False)
+    buf = []
+    total = 0
+    for p in reader.pages:
+        try:
+            t = p.extract_text() or ""
+        except Exception:
+            t = ""
+        buf.append(t)
+        total += len(t)
+        if total >= _MAX_TEXT_CHARS:
+            break
+    return "\n".join(buf)
+
 def load_text(path: str) -> str:
     ext = Path(path).suffix.lower()
     if ext in {".txt", ".md", ".markdown"}:
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
             return _clean(f.read())
     if ext == ".pdf":
-        reader = PdfReader(path)
-        pages = []
-        for p in reader.pages:
+        if _fitz is not None:
+            try:
+                return _clean(_extract_pdf_fitz(path))
+            except Exception:
+                pass  # weird PDF: try the next engine
+        if _pdfium is not None:
             try:
-                pages.append(p.extract_text() or "")
+                return _clean(_extract_pdf_pdfium(path))
             except Exception:
-                pages.append("")
-        return _clean("\n".join(pages))
+                pass  # weird PDF: fall back to pypdf below
+        return _clean(_extract_pdf_pypdf(path))
     if ext == ".docx":
+        if _docx2txt is not None:
+            try:
+                return _clean(_docx2txt.process(path)[:_MAX_TEXT_CHARS])
+            except Exception:
+                pass  # malformed archive: fall back to python-docx below
         doc = Document(path)
-        return _clean("\n".join(p.text for p in doc.paragraphs))
+        buf = []
+        total = 0
+        for p in doc.paragraphs:
+            buf.append(p.text)
+            total += len(p.text)
+            if total >= _MAX_TEXT_CHARS:
+                break
+        return _clean("\n".join(buf))
     # last-resort: try to read as plain text
     try:
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
@@ -41,31 +128,141 @@ def load_text(path: str) -> str:
         raise ValueError(f"Unsupported file type: {ext}")
 
 
+# Patterns compiled once at import: re's small internal cache lookup per
+# call is not free on per-line hot loops. The offline JD fallback's patterns
+# live in _jd_offline alongside the code that uses them.
+_RE_CRLF = re.compile(r"\r\n|\r")
+_RE_WS = re.compile(r"[ \t]+")
+_RE_BLANK3 = re.compile(r"\n{3,}")
+_RE_EMAIL_STRICT = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_RE_EMAIL = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.I)
+_RE_YEARS = re.compile(r"(\d{1,2})\s*\+?\s*years", re.I)
+
+
 def _clean(text: str) -> str:
     # Normalize whitespace and strip control chars
     text = text.replace("\x00", " ")
-    text = re.sub(r"\r\n|\r", "\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+    text = _RE_CRLF.sub("\n", text)
+    text = _RE_WS.sub(" ", text)
+    text = _RE_BLANK3.sub("\n\n", text).strip()
     return text
 
 
+# ---------- JSON helpers ----------
+
+# Optional accelerator: orjson serializes/deserializes several times faster
+# than stdlib json. Same pattern as pypdfium2 above — used when installed,
+# stdlib remains the baseline.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+def _from_json(data: str | bytes) -> Any:
+    return _orjson.loads(data) if _orjson is not None else json.loads(data)
+
+def _to_json(obj: Any, *, indent: bool = False) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
 # ---------- OpenAI JSON helper ----------
 
 class JsonParseError(RuntimeError): ...
 class OpenAIError(RuntimeError): ...
 
+# Connection pool shared across all parse calls so repeat requests reuse
+# keep-alive connections instead of opening a fresh TLS session each time.
+_HTTPX_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+
+@lru_cache(maxsize=1)
 def _client() -> OpenAI | None:
-    # Return client only if API key available; else None for offline fallback
+    # Return client only if API key available; else None for offline fallback.
+    # Cached: constructing OpenAI() allocates an httpx client and TLS pool,
+    # which is far too expensive to repeat per parse.
     api_key = os.getenv("OPENAI_API_KEY")
     if api_key and api_key.strip() and not api_key.startswith("your_"):
         try:
-            return OpenAI()  # Reads OPENAI_API_KEY from environment automatically
+            return OpenAI(http_client=httpx.Client(limits=_HTTPX_LIMITS))
         except Exception:
             # If client creation fails (invalid key, etc.), return None for fallback
             return None
     return None
 
+@lru_cache(maxsize=1)
+def _client_async() -> AsyncOpenAI | None:
+    # Async twin of _client(); same key handling, same offline semantics
+    api_key = os.getenv("OPENAI_API_KEY")
+    if api_key and api_key.strip() and not api_key.startswith("your_"):
+        try:
+            return AsyncOpenAI(http_client=httpx.AsyncClient(limits=_HTTPX_LIMITS))
+        except Exception:
+            return None
+    return None
+
+@atexit.register
+def _close_client() -> None:
+    # Close the pooled connections on exit, without constructing a client
+    # just to close it.
+    if _client.cache_info().currsize:
+        client = _client()
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
+    if _client_async.cache_info().currsize:
+        client = _client_async()
+        if client is not None:
+            try:
+                # The parse loop has exited by now, so spin a throwaway loop
+                # just to run the pool's async close.
+                asyncio.run(client.close())
+            except Exception:
+                pass
+
+class _JsonStreamScanner:
+    """Brace-balance tracker for streamed JSON, string/escape aware.
+
+    Lets the streaming read loop stop the moment the top-level object closes
+    instead of waiting for the connection to drain.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.started = False
+        self.in_str = False
+        self.esc = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume one chunk; returns True once the object is complete."""
+        for ch in chunk:
+            if self.esc:
+                self.esc = False
+            elif self.in_str:
+                if ch == "\\":
+                    self.esc = True
+                elif ch == '"':
+                    self.in_str = False
+            elif ch == '"':
+                self.in_str = True
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}":
+                self.depth -= 1
+                if self.started and self.depth == 0:
+                    return True
+        return False
+
+def _strict_json_kwargs() -> Dict[str, Any]:
+    # Server-side JSON mode re-validates output the prompt already pins down,
+    # and the stream scanner + retry + offline fallback catch the rare miss.
+    # Opt back into the stricter (slightly slower) mode with LLM_STRICT_JSON=1.
+    if os.getenv("LLM_STRICT_JSON") == "1":
+        return {"response_format": {"type": "json_object"}}
+    return {}
+
 @retry(
     stop=stop_after_attempt(2),                     # 1 try + 1 retry
     wait=wait_exponential(min=1, max=8),
@@ -75,60 +272,251 @@ def _client() -> OpenAI | None:
 def _chat_json(system: str, user: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
     """
     Call OpenAI chat in JSON mode; raise if JSON can't be parsed.
+
+    The response is streamed and reading stops as soon as the top-level JSON
+    object closes, trimming tail latency on long outputs.
     """
     client = _client()
     if client is None:
         raise OpenAIError("OPENAI_API_KEY not set; skipping online parse")
+    parts: List[str] = []
     try:
         resp = client.chat.completions.create(
             model=model,
             temperature=0,
-            response_format={"type": "json_object"},
             messages=[
                 {"role": "system", "content": system},
                 {"role": "user",    "content": user},
             ],
+            stream=True,
+            **_strict_json_kwargs(),
         )
+        scanner = _JsonStreamScanner()
+        try:
+            for chunk in resp:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                if scanner.feed(delta):
+                    break
+        finally:
+            resp.close()
     except Exception as e:
         raise OpenAIError(str(e)) from e
 
     try:
-        content = resp.choices[0].message.content
-        return json.loads(content)
+        return _from_json("".join(parts))
     except Exception as e:
         # Force a retry with a stricter instruction on second attempt
         raise JsonParseError("Model did not return valid JSON") from e
 
+@retry(
+    stop=stop_after_attempt(2),                     # 1 try + 1 retry
+    wait=wait_exponential(min=1, max=8),
+    retry=retry_if_exception_type((JsonParseError, OpenAIError)),
+    reraise=True,
+)
+async def _chat_json_async(system: str, user: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
+    """
+    Async variant of `_chat_json` for concurrent parsing paths.
+    """
+    client = _client_async()
+    if client is None:
+        raise OpenAIError("OPENAI_API_KEY not set; skipping online parse")
+    parts: List[str] = []
+    try:
+        resp = await client.chat.completions.create(
+            model=model,
+            temperature=0,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user",    "content": user},
+            ],
+            stream=True,
+            **_strict_json_kwargs(),
+        )
+        scanner = _JsonStreamScanner()
+        try:
+            async for chunk in resp:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                if scanner.feed(delta):
+                    break
+        finally:
+            await resp.close()
+    except Exception as e:
+        raise OpenAIError(str(e)) from e
+
+    try:
+        return _from_json("".join(parts))
+    except Exception as e:
+        raise JsonParseError("Model did not return valid JSON") from e
+
+# Models raced against each other when HR_RACE_MODELS=1: the common failure
+# mode is one model returning malformed JSON, so racing two cheap models and
+# taking the first valid response cuts the 1-8s serial-retry tail. Off by
+# default to avoid doubling token spend.
+_RACE_MODELS = ("gpt-4o-mini", "gpt-4.1-mini")
+
+async def _chat_json_raced_async(system: str, user: str) -> Dict[str, Any]:
+    tasks = [asyncio.create_task(_chat_json_async(system, user, m)) for m in _RACE_MODELS]
+    pending = set(tasks)
+    error: Exception | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+    raise error if error is not None else OpenAIError("No model produced a response")
+
+# ---------- LLM parse cache ----------
+#
+# LLM extractions are deterministic enough (temperature=0) to cache by content
+# hash: rerunning on unchanged JDs/resumes skips the network call entirely.
+# Keyed on (system prompt, user message, model); disable with HR_CACHE_DISABLE=1.
+
+CACHE_DIR = Path(os.path.expanduser("~")) / ".cache" / "hr-resume-agent"
+
+_MEM_CACHE: Dict[str, Dict[str, Any]] = {}
+
+def _cache_key(system: str, user: str, model: str) -> str:
+    return hashlib.sha256(f"{system}\x00{user}\x00{model}".encode("utf-8", errors="ignore")).hexdigest()
+
+def _cache_get(key: str) -> Dict[str, Any] | None:
+    hit = _MEM_CACHE.get(key)
+    if hit is not None:
+        return hit
+    path = CACHE_DIR / key[:2] / f"{key}.json"
+    try:
+        data = _from_json(path.read_bytes())
+    except Exception:
+        return None
+    _MEM_CACHE[key] = data
+    return data
+
+def _cache_set(key: str, value: Dict[str, Any]) -> None:
+    _MEM_CACHE[key] = value
+    path = CACHE_DIR / key[:2] / f"{key}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent runs never read a half-written entry
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(_to_json(value), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception:
+        pass  # cache is best-effort; never fail the parse over it
+
+def _chat_json_cached(system: str, user: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
+    if os.getenv("HR_CACHE_DISABLE") == "1":
+        return _chat_json(system, user, model)
+    key = _cache_key(system, user, model)
+    data = _cache_get(key)
+    if data is None:
+        data = _chat_json(system, user, model)
+        _cache_set(key, data)
+    return data
+
+async def _chat_json_cached_async(system: str, user: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
+    race = os.getenv("HR_RACE_MODELS") == "1"
+    if os.getenv("HR_CACHE_DISABLE") == "1":
+        return await (_chat_json_raced_async(system, user) if race
+                      else _chat_json_async(system, user, model))
+    key = _cache_key(system, user, model)
+    data = _cache_get(key)
+    if data is None:
+        data = await (_chat_json_raced_async(system, user) if race
+                      else _chat_json_async(system, user, model))
+        _cache_set(key, data)
+    return data
+
+# ---------- Prompt compression ----------
+#
+# Prompt tokens are paid directly in OpenAI latency and cost, and a 10-page
+# resume is mostly boilerplate. Before sending, long texts are cut down to
+# the sections the extractor actually needs; the original text is always
+# kept for the offline fallback.
+
+_COMPRESS_MAX_CHARS = 6_000
+_JD_KEEP = _any_of(["requirement", "qualification", "skill", "must", "nice",
+                    "preferred", "responsibilit"])
+_RESUME_KEEP = _any_of(["experience", "skill", "education", "qualification",
+                        "summary", "project", "employment", "work history"])
+
+def _compress_sections(text: str, keep: "re.Pattern[str]",
+                       head_lines: int = 15, max_section_lines: int = 40) -> str:
+    """Keep the document head plus whitelisted sections, capped per section,
+    with a hard character ceiling enforced by truncating the middle."""
+    if len(text) <= _COMPRESS_MAX_CHARS:
+        return text
+    lines = text.splitlines()
+    out = lines[:head_lines]
+    keeping = False
+    kept = 0
+    for line in lines[head_lines:]:
+        stripped = line.strip()
+        heading_like = stripped and len(stripped) <= 60
+        if heading_like and keep.search(stripped.lower()):
+            keeping = True
+            kept = 0
+            out.append(line)
+            continue
+        if keeping and heading_like and stripped.endswith(":"):
+            # A new, non-whitelisted heading closes the current section
+            keeping = False
+            continue
+        if keeping and kept < max_section_lines:
+            out.append(line)
+            kept += 1
+    compressed = "\n".join(out).strip() or text
+    if len(compressed) > _COMPRESS_MAX_CHARS:
+        half = _COMPRESS_MAX_CHARS // 2
+        compressed = compressed[:half] + "\n...\n" + compressed[-half:]
+    return compressed
+
+def _compress_jd(text: str) -> str:
+    return _compress_sections(text, _JD_KEEP)
+
+def _compress_resume(text: str) -> str:
+    return _compress_sections(text, _RESUME_KEEP)
+
 # ---------- JD / Resume extraction ----------
 
+JD_SYSTEM_PROMPT = (
+    "You are a job description parser. Extract structured data from the provided job description text.\n\n"
+    "Instructions:\n"
+    "- Extract the job title, removing any company prefix (e.g., 'Job:', 'Position:', '#')\n"
+    "- Find required skills/technologies (must-haves, requirements, qualifications)\n"
+    "- Find preferred skills/technologies (nice-to-haves, preferred, bonus)\n"
+    "- Extract location if mentioned\n"
+    "- Return concise skill names (e.g., 'React', 'Node.js', 'Python')\n"
+    "- Don't invent skills not mentioned in the text\n\n"
+    "Return a JSON object with exactly these fields:\n"
+    "{\n"
+    '  "title": "string - clean job title",\n'
+    '  "must_haves": ["array", "of", "required", "skills"],\n'
+    '  "nice_haves": ["array", "of", "preferred", "skills"],\n'
+    '  "location": "string or null"\n'
+    "}\n\n"
+    "Return ONLY the JSON object, no other text."
+)
+
 def parse_jd_to_struct(text: str) -> JD:
     """
     Returns JD(title, must_haves>=3 ideally, nice_haves, location?).
     Uses OpenAI LLM for robust extraction from any JD format.
     """
-    system = (
-        "You are a job description parser. Extract structured data from the provided job description text.\n\n"
-        "Instructions:\n"
-        "- Extract the job title, removing any company prefix (e.g., 'Job:', 'Position:', '#')\n"
-        "- Find required skills/technologies (must-haves, requirements, qualifications)\n"
-        "- Find preferred skills/technologies (nice-to-haves, preferred, bonus)\n"
-        "- Extract location if mentioned\n"
-        "- Return concise skill names (e.g., 'React', 'Node.js', 'Python')\n"
-        "- Don't invent skills not mentioned in the text\n\n"
-        "Return a JSON object with exactly these fields:\n"
-        "{\n"
-        '  "title": "string - clean job title",\n'
-        '  "must_haves": ["array", "of", "required", "skills"],\n'
-        '  "nice_haves": ["array", "of", "preferred", "skills"],\n'
-        '  "location": "string or null"\n'
-        "}\n\n"
-        "Return ONLY the JSON object, no other text."
-    )
-    
-    user = f"Job Description:\n\n{text}"
-    
+    user = f"Job Description:\n\n{_compress_jd(text)}"
+
     try:
-        data = _chat_json(system, user)
+        data = _chat_json_cached(JD_SYSTEM_PROMPT, user)
         
         # Clean and validate extracted data
         title = (data.get("title") or "").strip()
@@ -153,7 +541,8 @@ def parse_jd_to_struct(text: str) -> JD:
         if not must_haves:
             must_haves = ["General problem solving"]
         
-        return JD(
+        # Fields are already cleaned and typed above, so skip re-validation
+        return JD.model_construct(
             title=title,
             must_haves=must_haves[:8],  # Limit to 8
             nice_haves=nice_haves[:8],  # Limit to 8
@@ -161,213 +550,206 @@ def parse_jd_to_struct(text: str) -> JD:
         )
         
     except Exception as e:
-        # Enhanced offline fallback for when OpenAI API is not available
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        title = "Unknown Role"
-        must_haves = []
-        nice_haves = []
-        location = None
-        
-        # Extract title (look for headings with job roles)
-        for line in lines[:10]:
-            if any(word in line.lower() for word in ["developer", "engineer", "manager", "analyst", "designer", "architect", "lead", "senior"]):
-                title = re.sub(r"^[#\-\*\s]*", "", line).strip()
-                if ":" in title:
-                    title = title.split(":", 1)[1].strip()
-                break
-        
-        # Extract location
-        location_keywords = ["location", "remote", "hybrid", "office"]
-        for line in lines:
-            if any(keyword in line.lower() for keyword in location_keywords) and (":" in line or "," in line):
-                location = line.split(":", 1)[-1].split(",")[-1].strip()
-                break
-        
-        # Extract skills from must-have and nice-to-have sections
-        in_must_section = False
-        in_nice_section = False
-        
-        for line in lines:
-            line_lower = line.lower()
-            
-            # Detect section headers
-            if any(header in line_lower for header in ["must-have", "must have", "requirements", "required", "qualifications"]):
-                in_must_section = True
-                in_nice_section = False
-                continue
-            elif any(header in line_lower for header in ["nice-to-have", "nice to have", "preferred", "bonus", "optional"]):
-                in_nice_section = True
-                in_must_section = False
-                continue
-            elif any(header in line_lower for header in ["responsibilities", "about", "interview", "experience"]) and not any(skill in line_lower for skill in ["python", "react", "node"]):
-                in_must_section = False
-                in_nice_section = False
-                continue
-            
-            # Extract skills from current section
-            if in_must_section or in_nice_section:
-                # Remove markdown formatting and bullets
-                cleaned = re.sub(r"^\s*[-*•]\s*", "", line)
-                cleaned = re.sub(r"\*\*(.*?)\*\*", r"\1", cleaned)  # Remove **bold**
-                
-                # Extract individual skills
-                if cleaned and len(cleaned) > 3:
-                    # Look for parenthetical clarifications like "(hooks, routing)"
-                    parens = re.findall(r"\((.*?)\)", cleaned)
-                    for paren in parens:
-                        skills_in_paren = [s.strip() for s in re.split(r"[,;]", paren) if s.strip()]
-                        if in_must_section:
-                            must_haves.extend(skills_in_paren)
-                        else:
-                            nice_haves.extend(skills_in_paren)
-                    
-                    # Extract main skills (removing parentheses)
-                    main_line = re.sub(r"\([^)]*\)", "", cleaned).strip()
-                    if main_line:
-                        # Split on common delimiters
-                        parts = re.split(r"[;,]\s*", main_line)
-                        for part in parts:
-                            part = part.strip()
-                            if part and len(part) > 2:
-                                if in_must_section:
-                                    must_haves.append(part)
-                                else:
-                                    nice_haves.append(part)
-        
-        # Clean and deduplicate skills
-        def clean_skills(skills_list):
-            cleaned = []
-            seen = set()
-            for skill in skills_list:
-                # Clean up the skill name
-                clean = re.sub(r"^(and|with|for|using|in)\s+", "", skill, flags=re.I)
-                clean = re.sub(r"\s+(and|with|for|using|in)$", "", clean, flags=re.I)
-                clean = re.sub(r"[^\w\s\.\+\-#/]", "", clean).strip()
-                
-                if clean and len(clean) > 1 and clean.lower() not in seen:
-                    seen.add(clean.lower())
-                    cleaned.append(clean)
-            return cleaned[:8]
-        
-        must_haves = clean_skills(must_haves)
-        nice_haves = clean_skills(nice_haves)
-        
-        # If still no must-haves, try keyword extraction from the full text
-        if not must_haves:
-            tech_keywords = [
-                "React", "Node.js", "Express", "MongoDB", "TypeScript", "JavaScript", "Python", 
-                "Django", "Flask", "SQL", "PostgreSQL", "MySQL", "Redis", "Docker", "Kubernetes",
-                "AWS", "Azure", "GCP", "Git", "Jest", "Redux", "Next.js", "Vue", "Angular"
-            ]
-            text_lower = text.lower()
-            found_skills = []
-            for keyword in tech_keywords:
-                if keyword.lower() in text_lower:
-                    found_skills.append(keyword)
-            must_haves = found_skills[:6] if found_skills else ["General problem solving"]
-                
+        # Offline heuristic fallback for when OpenAI API is not available,
+        # kept in its own typed module (see _jd_offline) and cached per text
+        title, must_haves, nice_haves, location = _jd_offline.extract(text)
         return JD(
-            title=title[:100],
-            must_haves=must_haves,
-            nice_haves=nice_haves,
+            title=title,
+            must_haves=list(must_haves),
+            nice_haves=list(nice_haves),
             location=location
         )
 
+RESUME_SYSTEM_PROMPT = (
+    "You are a resume parser. Extract structured data from the provided resume text.\n\n"
+    "Instructions:\n"
+    "- Extract the candidate's full name\n"
+    "- Find email address if present\n"
+    "- Calculate total years of professional experience (not including education/internships)\n"
+    "- Extract technical skills, programming languages, frameworks, tools\n"
+    "- Return concise skill names (e.g., 'React', 'Python', 'AWS')\n"
+    "- Don't invent information not in the resume\n\n"
+    "Return a JSON object with exactly these fields:\n"
+    "{\n"
+    '  "name": "string - full name",\n'
+    '  "email": "string or null - email address",\n'
+    '  "years_exp": number - total years of experience,\n'
+    '  "skills": ["array", "of", "technical", "skills"]\n'
+    "}\n\n"
+    "Return ONLY the JSON object, no other text."
+)
+
+def _candidate_from_data(data: Dict[str, Any], path: str) -> Candidate:
+    """Clean and validate LLM-extracted resume data into a Candidate."""
+    name = (data.get("name") or "").strip()
+    if not name:
+        # Try to extract from filename as fallback
+        from pathlib import Path as _P
+        name = _P(path).stem.replace("_", " ").replace("-", " ").strip().title() or "Unknown"
+
+    email = data.get("email")
+    if email and not _RE_EMAIL_STRICT.search(str(email)):
+        email = None
+
+    years_exp = data.get("years_exp", 0)
+    try:
+        years_exp = int(years_exp) if years_exp is not None else 0
+        years_exp = max(0, min(years_exp, 50))  # Clamp between 0-50
+    except (ValueError, TypeError):
+        years_exp = 0
+
+    skills = data.get("skills", [])
+    if not isinstance(skills, list):
+        skills = []
+    skills = [s.strip() for s in skills if isinstance(s, str) and s.strip()]
+
+    # Cleanup above guarantees field types, so skip per-field validation on
+    # this bulk-ingest hot path; fallback paths keep the validated constructor.
+    return Candidate.model_construct(
+        name=name,
+        email=email,
+        years_exp=years_exp,
+        skills=skills[:15],  # Limit to 15
+        resume_path=path
+    )
+
+def _candidate_fallback(text: str, path: str) -> Candidate:
+    """Offline regex fallback when the LLM parse is unavailable or fails."""
+    from pathlib import Path as _P
+
+    # Extract email
+    email = None
+    email_match = _RE_EMAIL.search(text)
+    if email_match:
+        email = email_match.group(0)
+
+    # Extract name from filename
+    name = _P(path).stem.replace("_", " ").replace("-", " ").strip().title() or "Unknown"
+
+    # Simple years extraction
+    years_exp = 0
+    year_matches = _RE_YEARS.findall(text)
+    if year_matches:
+        years_exp = max([int(y) for y in year_matches if int(y) <= 50] or [0])
+
+    return Candidate(
+        name=name,
+        email=email,
+        years_exp=years_exp,
+        skills=[],
+        resume_path=path
+    )
+
 def parse_resume_to_struct(text: str, path: str) -> Candidate:
     """
     Returns Candidate(name, email?, years_exp, skills[]).
     Uses OpenAI LLM for robust extraction from any resume format.
     """
+    try:
+        data = _chat_json_cached(RESUME_SYSTEM_PROMPT, f"Resume:\n\n{_compress_resume(text)}")
+        return _candidate_from_data(data, path)
+    except Exception:
+        return _candidate_fallback(text, path)
+
+async def parse_resume_to_struct_async(text: str, path: str) -> Candidate:
+    """Async variant of `parse_resume_to_struct` for concurrent ingestion."""
+    try:
+        data = await _chat_json_cached_async(RESUME_SYSTEM_PROMPT, f"Resume:\n\n{_compress_resume(text)}")
+        return _candidate_from_data(data, path)
+    except Exception:
+        return _candidate_fallback(text, path)
+
+# Resumes per LLM call: amortizes network RTT and system-prompt tokens
+_BATCH_SIZE = 8
+
+async def parse_resumes_batch(texts: List[tuple[str, str]]) -> List[Candidate]:
+    """
+    Parse several resumes with one LLM round-trip on the async client.
+
+    `texts` holds (resume_text, path) pairs. The model is asked for a JSON
+    object {"resumes": [...]} with one entry per input, in order. On any
+    batch-level failure each resume is retried individually, so one bad
+    resume can't sink the whole group.
+    """
+    if not texts:
+        return []
     system = (
-        "You are a resume parser. Extract structured data from the provided resume text.\n\n"
-        "Instructions:\n"
-        "- Extract the candidate's full name\n"
-        "- Find email address if present\n"
-        "- Calculate total years of professional experience (not including education/internships)\n"
-        "- Extract technical skills, programming languages, frameworks, tools\n"
-        "- Return concise skill names (e.g., 'React', 'Python', 'AWS')\n"
-        "- Don't invent information not in the resume\n\n"
-        "Return a JSON object with exactly these fields:\n"
-        "{\n"
-        '  "name": "string - full name",\n'
-        '  "email": "string or null - email address",\n'
-        '  "years_exp": number - total years of experience,\n'
-        '  "skills": ["array", "of", "technical", "skills"]\n'
-        "}\n\n"
-        "Return ONLY the JSON object, no other text."
+        RESUME_SYSTEM_PROMPT
+        + f"\n\nYou will receive {len(texts)} resumes, delimited by '--- RESUME i ---' markers.\n"
+        'Return a JSON object {"resumes": [...]} with one entry per resume, in the same order.'
     )
-    
-    user = f"Resume:\n\n{text}"
-    
+    user = "\n".join(f"--- RESUME {i} ---\n{_compress_resume(text)}\n" for i, (text, _path) in enumerate(texts, 1))
     try:
-        data = _chat_json(system, user)
-        
-        # Clean and validate extracted data
-        name = (data.get("name") or "").strip()
-        if not name:
-            # Try to extract from filename as fallback
-            from pathlib import Path as _P
-            name = _P(path).stem.replace("_", " ").replace("-", " ").strip().title() or "Unknown"
-            
-        email = data.get("email")
-        if email and not re.search(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", str(email)):
-            email = None
-            
-        years_exp = data.get("years_exp", 0)
-        try:
-            years_exp = int(years_exp) if years_exp is not None else 0
-            years_exp = max(0, min(years_exp, 50))  # Clamp between 0-50
-        except (ValueError, TypeError):
-            years_exp = 0
-            
-        skills = data.get("skills", [])
-        if not isinstance(skills, list):
-            skills = []
-        skills = [s.strip() for s in skills if isinstance(s, str) and s.strip()]
-        
-        return Candidate(
-            name=name,
-            email=email,
-            years_exp=years_exp,
-            skills=skills[:15],  # Limit to 15
-            resume_path=path
-        )
-        
+        data = await _chat_json_cached_async(system, user)
+        entries = data.get("resumes")
+        if not isinstance(entries, list) or len(entries) != len(texts):
+            raise JsonParseError("Batch parse returned wrong number of entries")
+        return [
+            _candidate_from_data(entry if isinstance(entry, dict) else {}, path)
+            for entry, (_text, path) in zip(entries, texts)
+        ]
     except Exception:
-        # Simple fallback
-        from pathlib import Path as _P
-        
-        # Extract email
-        email = None
-        email_match = re.search(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", text, re.I)
-        if email_match:
-            email = email_match.group(0)
-            
-        # Extract name from filename
-        name = _P(path).stem.replace("_", " ").replace("-", " ").strip().title() or "Unknown"
-        
-        # Simple years extraction
-        years_exp = 0
-        year_matches = re.findall(r"(\d{1,2})\s*\+?\s*years", text, re.I)
-        if year_matches:
-            years_exp = max([int(y) for y in year_matches if int(y) <= 50] or [0])
-            
-        return Candidate(
-            name=name,
-            email=email,
-            years_exp=years_exp,
-            skills=[],
-            resume_path=path
-        )
+        return list(await asyncio.gather(
+            *(parse_resume_to_struct_async(text, path) for text, path in texts)
+        ))
 
-def parse_resumes_from_dir(res_dir: str) -> List[Candidate]:
-    out: List[Candidate] = []
-    for fn in os.listdir(res_dir):
-        path = os.path.join(res_dir, fn)
-        if not os.path.isfile(path):
-            continue
-        if os.path.splitext(path)[1].lower() not in {".txt", ".pdf", ".docx"}:
-            continue
-        txt = load_text(path)
-        out.append(parse_resume_to_struct(txt, path))
+_RESUME_EXTS = {".txt", ".pdf", ".docx"}
+
+def _resume_paths(res_dir: str) -> List[str]:
+    # scandir DirEntry objects cache stat results, so filtering a big resume
+    # folder costs one syscall per entry instead of listdir + stat each.
+    out: List[str] = []
+    with os.scandir(res_dir) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            dot = name.rfind(".")
+            if dot < 0 or name[dot:].lower() not in _RESUME_EXTS:
+                continue
+            out.append(entry.path)
     return out
+
+async def parse_resumes_from_dir_async(res_dir: str, *, concurrency: int = 8) -> List[Candidate]:
+    """
+    Parse all resumes in a directory as a two-stage pipeline: file loads
+    (CPU-bound PDF work) run in threads while completed groups go to the LLM
+    in batched requests, so extraction overlaps network wait instead of
+    running before it. The semaphore bounds in-flight LLM requests to avoid
+    rate-limit storms.
+    """
+    paths = _resume_paths(res_dir)
+    sem = asyncio.Semaphore(concurrency)
+    results: List[Candidate | None] = [None] * len(paths)
+
+    async def _load(i: int, path: str) -> tuple[int, str, str]:
+        return i, path, await asyncio.to_thread(load_text, path)
+
+    async def _parse_group(group: List[tuple[int, str, str]]) -> None:
+        async with sem:
+            cands = await parse_resumes_batch([(text, path) for _i, path, text in group])
+        for (i, _path, _text), cand in zip(group, cands):
+            results[i] = cand
+
+    # Dispatch each LLM batch as soon as enough files have loaded, rather
+    # than waiting for the whole directory to finish extracting.
+    parse_tasks: List[asyncio.Task] = []
+    group: List[tuple[int, str, str]] = []
+    for fut in asyncio.as_completed([_load(i, p) for i, p in enumerate(paths)]):
+        group.append(await fut)
+        if len(group) >= _BATCH_SIZE:
+            parse_tasks.append(asyncio.create_task(_parse_group(group)))
+            group = []
+    if group:
+        parse_tasks.append(asyncio.create_task(_parse_group(group)))
+    if parse_tasks:
+        await asyncio.gather(*parse_tasks)
+    # Directory order, regardless of which loads/batches finished first
+    return [c for c in results if c is not None]
+
+def parse_resumes_from_dir(res_dir: str) -> List[Candidate]:
+    try:
+        concurrency = int(os.getenv("RESUME_PARSE_CONCURRENCY", "8"))
+    except ValueError:
+        concurrency = 8
+    return asyncio.run(parse_resumes_from_dir_async(res_dir, concurrency=max(1, concurrency)))